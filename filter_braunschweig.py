@@ -1,12 +1,14 @@
 #!/usr/bin/env python3
 # filter_braunschweig.py
+import hashlib
 import requests
 import os
+import re
 import sys
 import logging
-from datetime import datetime, timezone
-from zoneinfo import ZoneInfo
-from ics import Calendar
+from datetime import datetime, timedelta, timezone
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # --- Konfiguration ---
 URL = "http://api.basketball-bundesliga.de/calendar/ical/all-games"
@@ -17,7 +19,6 @@ TEAM_VARIANTS = [
     "Basketball Löwen",
 ]
 OUT_FILE = "loewen_braunschweig.ics"
-BAK_FILE = OUT_FILE + ".bak"
 NEW_FILE = OUT_FILE + ".new"
 META_FILE = ".feedmeta"
 REMOVE_PREFIXES = [
@@ -27,7 +28,12 @@ TZID = "Europe/Berlin"
 # ----------------------
 
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
-LOCAL_TZ = ZoneInfo(TZID)
+
+# One keep-alive connection shared by the HEAD, conditional GET and fallback GET
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_connections=1, pool_maxsize=1, max_retries=Retry(total=3, backoff_factor=0.3))
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
 
 
 VTIMEZONE_BLOCK = """BEGIN:VTIMEZONE
@@ -46,7 +52,23 @@ TZNAME:CEST
 DTSTART:19700329T020000
 END:DAYLIGHT
 END:VTIMEZONE
-""".format(tz=TZID)
+""".format(tz=TZID).strip()
+
+# The VEVENT properties we publish: name, parameters (quoted values may contain ':'), raw value
+_FIELD_RE = re.compile(r'^(UID|SUMMARY|DESCRIPTION|LOCATION|DTSTART|DTEND|DURATION|DTSTAMP)'
+                       r'((?:;(?:"[^"]*"|[^";:\r\n])*)*):([^\r\n]*)', re.M)
+# Basic-format DATE / DATE-TIME values: date, optional time, optional Z
+_BASIC_DT_RE = re.compile(r"(\d{8})(?:T(\d{6}))?Z?")
+_LOWER_VARIANTS = tuple(v.lower() for v in TEAM_VARIANTS)
+# A variant containing another variant never decides a match on its own ("braunschweig" covers
+# "löwen braunschweig"), so only the minimal set is searched for
+_TEAM_NEEDLES = tuple(v for v in _LOWER_VARIANTS if not any(o != v and o in v for o in _LOWER_VARIANTS))
+_LOWERED_PREFIXES = tuple((p.lower(), len(p)) for p in REMOVE_PREFIXES)
+_LOWERED_PREFIX_TUPLE = tuple(lp for lp, _ in _LOWERED_PREFIXES)
+_sha1 = hashlib.sha1
+_ICAL_ESCAPE = str.maketrans({"\\": "\\\\", "\n": "\\n", ",": "\\,", ";": "\\;"})
+_ICAL_UNESCAPE = {"\\": "\\", ",": ",", ";": ";", "n": "\n", "N": "\n"}
+_ICAL_UNESCAPE_RE = re.compile(r"\\([\\,;nN])")
 
 
 def load_meta():
@@ -76,32 +98,73 @@ def save_meta(meta):
         logging.warning("Could not write meta: %s", e)
 
 
+def meta_from_response(r):
+    """
+    Build the .feedmeta entries for a 200 response: server validators plus a SHA-256 of the body,
+    which catches unchanged feeds even when the server sends no usable ETag/Last-Modified.
+    """
+    new_meta = {}
+    if r.headers.get("ETag"):
+        new_meta["ETag"] = r.headers.get("ETag")
+    if r.headers.get("Last-Modified"):
+        new_meta["Last-Modified"] = r.headers.get("Last-Modified")
+    new_meta["BodyHash"] = hashlib.sha256(r.content).hexdigest()
+    return new_meta
+
+
+def head_unchanged(meta):
+    """
+    Ask the server for headers only and report whether ETag/Last-Modified still match meta.
+    Any failure or missing validator returns False so the regular conditional GET runs.
+    """
+    try:
+        h = _SESSION.head(URL, timeout=10, allow_redirects=True)
+    except requests.RequestException as e:
+        logging.warning("HEAD request failed: %s", e)
+        return False
+    logging.info("HEAD %s received", h.status_code)
+    if not h.ok:
+        return False
+    if meta.get("ETag") and h.headers.get("ETag"):
+        return h.headers["ETag"] == meta["ETag"]
+    if meta.get("Last-Modified") and h.headers.get("Last-Modified"):
+        return h.headers["Last-Modified"] == meta["Last-Modified"]
+    return False
+
+
 def fetch():
     headers = {}
     meta = load_meta()
+    if (meta.get("ETag") or meta.get("Last-Modified")) and os.path.exists(OUT_FILE) and head_unchanged(meta):
+        logging.info("Feed not modified (HEAD).")
+        return None, meta
     if meta.get("ETag"):
         headers["If-None-Match"] = meta["ETag"]
     if meta.get("Last-Modified"):
         headers["If-Modified-Since"] = meta["Last-Modified"]
     logging.info("Requesting feed... headers=%s", headers)
-    r = requests.get(URL, headers=headers, timeout=30)
+    r = _SESSION.get(URL, headers=headers, timeout=30)
     logging.info("HTTP %s received", r.status_code)
     if r.status_code == 304:
         logging.info("Feed not modified (304).")
         return None, meta
     r.raise_for_status()
-    new_meta = {}
-    if r.headers.get("ETag"):
-        new_meta["ETag"] = r.headers.get("ETag")
-    if r.headers.get("Last-Modified"):
-        new_meta["Last-Modified"] = r.headers.get("Last-Modified")
+    logging.info("Content-Encoding=%s, %s bytes on the wire, %d bytes decoded",
+                 r.headers.get("Content-Encoding", "identity"), r.headers.get("Content-Length", "?"), len(r.content))
+    new_meta = meta_from_response(r)
+    if meta.get("BodyHash") == new_meta["BodyHash"] and os.path.exists(OUT_FILE):
+        logging.info("Feed body unchanged (hash match).")
+        return None, new_meta
+    r.encoding = "utf-8"  # RFC 5545 default; skips requests' charset sniffing
     return r.text, new_meta
 
 
 def matches_team(text):
-    txt = (text or "").lower()
-    for v in TEAM_VARIANTS:
-        if v.lower() in txt:
+    if not text:
+        return False
+    txt = text.lower()
+    for v in _TEAM_NEEDLES:
+        if v in txt:
             return True
     return False
 
@@ -111,169 +174,257 @@ def clean_summary(name):
         return name
     n = name.strip()
     ln = n.lower()
-    for p in REMOVE_PREFIXES:
-        if ln.startswith(p.lower()):
-            n = n[len(p):].lstrip()
-            break
+    if not ln.startswith(_LOWERED_PREFIX_TUPLE):
+        return n
+    for lp, plen in _LOWERED_PREFIXES:
+        if ln.startswith(lp):
+            return n[plen:].lstrip()
     return n
 
 
-def ensure_datetime(obj):
+def wallclock_string(value):
     """
-    Return a datetime (naive or aware) from various ics types or datetime.
+    Return the wall-clock part of a DTSTART/DTEND value as YYYYMMDDTHHMMSS, or None if it is not
+    basic format (surrounding whitespace is ignored). Whatever zone the feed used, these digits are written with TZID=Europe/Berlin,
+    which preserves the displayed clock time. All-day dates become midnight.
     """
-    if obj is None:
+    m = _BASIC_DT_RE.fullmatch(value.strip())
+    if not m:
         return None
-    try:
-        if hasattr(obj, "naive"):
-            return obj.naive  # naive datetime
-        if hasattr(obj, "datetime"):
-            return obj.datetime  # possibly aware
-    except Exception:
-        pass
-    return obj
+    return m.group(1) + "T" + (m.group(2) or "000000")
 
 
-def wallclock_as_local_naive(dt):
+def utc_stamp(params, value):
     """
-    Interpret the wall-clock time of dt as Europe/Berlin local time and return naive local datetime.
-    Rules:
-      - If dt is aware (has tzinfo), take its wall-clock components (year,month,day,hour,minute,second)
-        and build a LOCAL_TZ-aware datetime with those components, then return naive local datetime.
-      - If dt is naive, take its components as-is and treat them as LOCAL_TZ local time.
-    This preserves the displayed clock time while writing TZID=Europe/Berlin.
+    Return a UTC DATE-TIME value (YYYYMMDDTHHMMSSZ), or None if it cannot be read as one.
+    Floating values are taken as UTC; RFC 5545 requires DTSTAMP/CREATED in UTC anyway.
     """
-    if dt is None:
-        return None
-    py_dt = ensure_datetime(dt)
-    if py_dt is None:
+    value = value.strip()
+    m = _BASIC_DT_RE.fullmatch(value)
+    if not m or not m.group(2) or (not value.endswith("Z") and "TZID=" in params.upper()):
         return None
-    # Extract wall-clock fields
-    wc = dict(year=py_dt.year, month=py_dt.month, day=py_dt.day,
-              hour=py_dt.hour, minute=py_dt.minute, second=py_dt.second, microsecond=py_dt.microsecond)
-    # create a local-aware datetime using those fields
-    local_aware = datetime(**wc, tzinfo=LOCAL_TZ)
-    # return naive local (no tzinfo) for ICS writing with TZID
-    return local_aware.replace(tzinfo=None)
+    return m.group(1) + "T" + m.group(2) + "Z"
 
 
-def format_dt_as_local_string(dt):
-    return dt.strftime("%Y%m%dT%H%M%S")
+def escape_ical_text(s):
+    return s.translate(_ICAL_ESCAPE)
 
 
-def escape_ical_text(s):
-    return s.replace("\\", "\\\\").replace("\n", "\\n").replace(",", "\\,").replace(";", "\\;")
-
-
-def build_ics_text_with_vtimezone(cal_out):
-    lines = []
-    lines.append("BEGIN:VCALENDAR")
-    lines.append("VERSION:2.0")
-    lines.append("PRODID:-//Filtered Calendar//EN")
-    lines.append(VTIMEZONE_BLOCK.strip())
-    for ev in cal_out.events:
-        lines.append("BEGIN:VEVENT")
-        uid = getattr(ev, "uid", None) or ""
+def unescape_ical_text(s):
+    if "\\" not in s:
+        return s
+    return _ICAL_UNESCAPE_RE.sub(lambda m: _ICAL_UNESCAPE[m.group(1)], s)
+
+
+def event_matches(fields):
+    """
+    Return True if SUMMARY, DESCRIPTION or LOCATION mentions the team, checked in that order.
+    Later fields are not even unescaped once an earlier one matched.
+    """
+    for key in ("SUMMARY", "DESCRIPTION", "LOCATION"):
+        if key in fields and matches_team(unescape_ical_text(fields[key][1])):
+            return True
+    return False
+
+
+def unfold(text):
+    """
+    Undo RFC 5545 line folding (a line break followed by a space or tab).
+    """
+    return text.replace("\r\n ", "").replace("\r\n\t", "").replace("\n ", "").replace("\n\t", "")
+
+
+def iter_matching_spans(unfolded):
+    """
+    Yield (start, end) of every VEVENT block whose raw text mentions the team, end pointing at
+    the block's final line break.
+    Rather than testing every block, jump from one team-name hit in the lowered feed to the next
+    and take the block around it, so non-matching events are never sliced or lowered.
+    """
+    find = unfolded.find
+    lowered = unfolded.lower()
+    # Only "BEGIN:VEVENT" at the start of a line opens a block; the text may also occur in a value
+    first = 0 if unfolded.startswith("BEGIN:VEVENT") else -1
+    if len(lowered) != len(unfolded):
+        # lower() changed the length (e.g. "İ"), so offsets no longer line up: test block by block
+        pos = 0
+        while True:
+            if pos == 0 and first == 0:
+                start = 0
+            else:
+                start = find("\nBEGIN:VEVENT", pos)
+                start = start + 1 if start >= 0 else -1
+            end = find("\nEND:VEVENT", start) if start >= 0 else -1
+            if end < 0:
+                return
+            pos = end + len("\nEND:VEVENT")
+            if matches_team(unfolded[start:pos]):
+                yield start, end
+    # Next hit per needle, only refreshed once the scan has moved past it
+    hits = {v: lowered.find(v) for v in _TEAM_NEEDLES}
+    pos = 0
+    while True:
+        hit = min((h for h in hits.values() if h >= 0), default=-1)
+        if hit < 0:
+            return
+        start = unfolded.rfind("\nBEGIN:VEVENT", pos, hit)
+        start = start + 1 if start >= 0 else first if pos == 0 else -1
+        end = find("\nEND:VEVENT", start) if start >= 0 else -1
+        if start >= 0 and end < 0:
+            return
+        if start < 0:
+            pos = hit + 1  # hit outside any event, e.g. in the calendar header
+        elif end < hit:
+            pos = end  # hit lies after this (non-matching) block
+        else:
+            pos = end + len("\nEND:VEVENT")
+            yield start, end
+        for v, h in hits.items():
+            if 0 <= h < pos:
+                hits[v] = lowered.find(v, pos)
+
+
+def iter_candidate_events(ics_text):
+    """
+    Yield the properties of every VEVENT block whose raw text mentions the team.
+    The few matching blocks are picked apart with _FIELD_RE as {name: (params, raw value)},
+    keeping the first occurrence of each property.
+    """
+    unfolded = unfold(ics_text)
+    find = unfolded.find
+    for start, end in iter_matching_spans(unfolded):
+        fields = {}
+        pos = start
+        while pos < end:
+            # Only the event's own properties: skip nested components such as VALARM, which may
+            # appear anywhere in the event, and keep scanning the lines after them
+            sub = find("\nBEGIN:", pos, end)
+            for m in _FIELD_RE.finditer(unfolded, pos, sub if sub >= 0 else end):
+                fields.setdefault(m.group(1), (m.group(2), m.group(3)))
+            if sub < 0:
+                break
+            eol = find("\n", sub + 1, end)
+            if eol < 0:
+                break
+            close = "\nEND:" + unfolded[sub + len("\nBEGIN:"):eol].rstrip("\r")
+            pos = find(close, eol, end)
+            if pos < 0:
+                break
+            pos += len(close)
+        yield fields
+
+
+def build_ics_parts(ics_text):
+    """
+    Filter the feed in a single pass and return (parts, matched): the output calendar as a list of
+    UTF-8 encoded, CRLF-terminated lines ready for b"".join, and the number of events written.
+    """
+    parts = []
+    # Local bindings for the per-event loop
+    emit = parts.append
+    esc = escape_ical_text
+    unesc = unescape_ical_text
+    wallclock = wallclock_string
+    no_field = ("", "")
+
+    emit(b"BEGIN:VCALENDAR\r\n")
+    emit(b"VERSION:2.0\r\n")
+    emit(b"PRODID:-//Filtered Calendar//EN\r\n")
+    emit((VTIMEZONE_BLOCK + "\r\n").encode())
+    # DTSTAMP is when this calendar object was produced: one value for the whole run
+    dtstamp = datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+    matched = 0
+    for fields in iter_candidate_events(ics_text):
+        if not event_matches(fields):
+            continue
+        name = unesc(fields.get("SUMMARY", no_field)[1])
+        # An event without a start is invalid, so leave it out rather than publish it
+        start_value = fields.get("DTSTART", no_field)[1].strip()
+        begin = wallclock(start_value)
+        if not begin:
+            logging.warning("Skipping event %r: unreadable DTSTART %r", name, start_value)
+            continue
+        desc = unesc(fields.get("DESCRIPTION", no_field)[1])
+        loc = unesc(fields.get("LOCATION", no_field)[1])
+        emit(b"BEGIN:VEVENT\r\n")
+        uid = fields.get("UID", no_field)[1]
         if uid:
-            lines.append(f"UID:{uid}")
-        summary = getattr(ev, "name", "") or ""
-        lines.append(f"SUMMARY:{escape_ical_text(summary)}")
-        desc = getattr(ev, "description", "") or ""
+            emit(f"UID:{uid}\r\n".encode())
+        summary = clean_summary(name)
+        emit(f"SUMMARY:{esc(summary)}\r\n".encode())
         if desc:
-            lines.append(f"DESCRIPTION:{escape_ical_text(desc)}")
-        loc = getattr(ev, "location", "") or ""
+            emit(f"DESCRIPTION:{esc(desc)}\r\n".encode())
         if loc:
-            lines.append(f"LOCATION:{escape_ical_text(loc)}")
+            emit(f"LOCATION:{esc(loc)}\r\n".encode())
 
         # BEGIN/END times: preserve wall-clock time and write TZID=Europe/Berlin
-        b = getattr(ev, "begin", None)
-        e = getattr(ev, "end", None)
-        b_dt = ensure_datetime(b)
-        e_dt = ensure_datetime(e)
-
-        b_local_naive = wallclock_as_local_naive(b_dt) if b_dt is not None else None
-        e_local_naive = wallclock_as_local_naive(e_dt) if e_dt is not None else None
-
-        if b_local_naive:
-            lines.append(f"DTSTART;TZID={TZID}:{format_dt_as_local_string(b_local_naive)}")
-        if e_local_naive:
-            lines.append(f"DTEND;TZID={TZID}:{format_dt_as_local_string(e_local_naive)}")
-
-        # CREATED/DTSTAMP remain UTC if possible
-        created = getattr(ev, "created", None)
-        if created:
-            try:
-                c_dt = ensure_datetime(created)
-                if getattr(c_dt, "tzinfo", None) is None:
-                    c_aware = c_dt.replace(tzinfo=timezone.utc)
-                else:
-                    c_aware = c_dt
-                lines.append(f"CREATED:{c_aware.astimezone(timezone.utc).strftime('%Y%m%dT%H%M%SZ')}")
-            except Exception:
-                pass
-
-        lines.append(f"DTSTAMP:{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')}")
+        end = wallclock(fields.get("DTEND", no_field)[1])
+        emit(f"DTSTART;TZID={TZID}:{begin}\r\n".encode())
+        if end:
+            emit(f"DTEND;TZID={TZID}:{end}\r\n".encode())
+        elif "DURATION" in fields:
+            emit(f"DURATION:{fields['DURATION'][1]}\r\n".encode())
+        elif "T" not in start_value:
+            # An all-day DTSTART without DTEND/DURATION lasts one day; it must not become an instant
+            next_day = datetime.strptime(begin[:8], "%Y%m%d") + timedelta(days=1)
+            emit(f"DTEND;TZID={TZID}:{next_day:%Y%m%d}T000000\r\n".encode())
+
+        # The source DTSTAMP has always been published as CREATED (that is what ics exposed)
+        if "DTSTAMP" in fields:
+            created = utc_stamp(*fields["DTSTAMP"])
+            if created:
+                emit(f"CREATED:{created}\r\n".encode())
+
+        emit(f"DTSTAMP:{dtstamp}\r\n".encode())
 
         if not uid:
-            key = (summary + (format_dt_as_local_string(b_local_naive) if b_local_naive else "")).encode("utf-8")
-            import hashlib
-            uid_gen = hashlib.sha1(key).hexdigest() + "@generated"
-            lines.append(f"UID:{uid_gen}")
-
-        lines.append("END:VEVENT")
-    lines.append("END:VCALENDAR")
-    return "\r\n".join(lines) + "\r\n"
+            key = (summary + begin).encode("utf-8")
+            uid_gen = _sha1(key).hexdigest() + "@generated"
+            emit(f"UID:{uid_gen}\r\n".encode())
 
-
-def filter_calendar_to_string_with_tz(ics_text):
-    cal = Calendar(ics_text)
-    out = Calendar()
-    matched = 0
-    for ev in cal.events:
-        combined = " ".join(filter(None, [getattr(ev, "name", ""), getattr(ev, "description", ""), getattr(ev, "location", "")]))
-        if matches_team(combined):
-            try:
-                ev.name = clean_summary(getattr(ev, "name", None))
-            except Exception:
-                pass
-            out.events.add(ev)
-            matched += 1
-    text = build_ics_text_with_vtimezone(out)
-    return text, matched
+        emit(b"END:VEVENT\r\n")
+        matched += 1
+    emit(b"END:VCALENDAR\r\n")
+    return parts, matched
 
 
-def atomic_replace_with_backup(new_text):
+def atomic_replace(data):
+    """
+    Replace OUT_FILE with data (bytes): write and fsync NEW_FILE, os.replace it over OUT_FILE,
+    then fsync the directory so the rename survives a crash as well.
+    OUT_FILE is always either the complete old or the complete new file, so no backup copy is needed.
+    """
     try:
-        if os.path.exists(OUT_FILE):
-            if os.path.exists(BAK_FILE):
-                os.remove(BAK_FILE)
-            os.replace(OUT_FILE, BAK_FILE)
-            logging.info("Existing %s moved to backup %s", OUT_FILE, BAK_FILE)
-        with open(NEW_FILE, "w", encoding="utf-8") as f:
-            f.write(new_text)
+        fd = os.open(NEW_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
         logging.info("Wrote new temp file %s", NEW_FILE)
         os.replace(NEW_FILE, OUT_FILE)
         logging.info("Replaced %s with new file", OUT_FILE)
-        if os.path.exists(BAK_FILE):
-            os.remove(BAK_FILE)
-            logging.info("Removed backup %s", BAK_FILE)
-        return True
     except Exception as e:
         logging.error("Error during atomic replace: %s", e)
         try:
-            if os.path.exists(NEW_FILE):
-                os.remove(NEW_FILE)
+            os.remove(NEW_FILE)
         except Exception:
             pass
-        try:
-            if os.path.exists(BAK_FILE):
-                if os.path.exists(OUT_FILE):
-                    os.remove(OUT_FILE)
-                os.replace(BAK_FILE, OUT_FILE)
-                logging.info("Restored backup %s to %s", BAK_FILE, OUT_FILE)
-        except Exception as e2:
-            logging.error("Failed to restore backup: %s", e2)
         return False
+    # Persist the rename itself; directories cannot be opened/fsynced on Windows.
+    # OUT_FILE already holds the new content here, so a failure is only worth a warning.
+    if hasattr(os, "O_DIRECTORY"):
+        try:
+            dir_fd = os.open(os.path.dirname(os.path.abspath(OUT_FILE)), os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+        except OSError as e:
+            logging.warning("Could not fsync directory of %s: %s", OUT_FILE, e)
+    return True
 
 
 def main():
@@ -283,36 +434,27 @@ def main():
         if ics_text is None:
             if not os.path.exists(OUT_FILE):
                 logging.info("No existing output file but feed reported 304/None — forcing fresh fetch without conditional headers.")
-                r = requests.get(URL, timeout=30)
+                r = _SESSION.get(URL, timeout=30)
                 r.raise_for_status()
+                r.encoding = "utf-8"
                 ics_text = r.text
-                new_meta = {}
-                if r.headers.get("ETag"):
-                    new_meta["ETag"] = r.headers.get("ETag")
-                if r.headers.get("Last-Modified"):
-                    new_meta["Last-Modified"] = r.headers.get("Last-Modified")
+                new_meta = meta_from_response(r)
             else:
+                save_meta(new_meta)
                 logging.info("No update needed. Exiting.")
                 return 0
-        new_text, matched = filter_calendar_to_string_with_tz(ics_text)
-        logging.info("Found %d matching events", matched)
+        parts, matched = build_ics_parts(ics_text)
         logging.info("Preparing atomic replace of %s", OUT_FILE)
-        ok = atomic_replace_with_backup(new_text)
+        ok = atomic_replace(b"".join(parts))
         if ok:
             save_meta(new_meta)
             logging.info("Update successful. Wrote %s with %d events.", OUT_FILE, matched)
             return 0
         else:
-            logging.error("Update failed; backup restored.")
+            logging.error("Update failed; %s left unchanged.", OUT_FILE)
             return 2
     except Exception as e:
         logging.error("Fatal error: %s", e)
-        try:
-            if os.path.exists(BAK_FILE) and not os.path.exists(OUT_FILE):
-                os.replace(BAK_FILE, OUT_FILE)
-                logging.info("Restored backup after fatal error.")
-        except Exception as e2:
-            logging.error("Failed to restore backup after fatal error: %s", e2)
         return 2
 
 
@@ -0,0 +1,86 @@
+import unittest
+
+import filter_braunschweig as fb
+
+
+def feed(*events):
+    """
+    Build a CRLF calendar from events given as lists of property lines.
+    """
+    lines = ["BEGIN:VCALENDAR", "VERSION:2.0", "PRODID:test"]
+    for props in events:
+        lines += ["BEGIN:VEVENT", *props, "END:VEVENT"]
+    lines.append("END:VCALENDAR")
+    return "\r\n".join(lines) + "\r\n"
+
+
+def filtered(ics_text):
+    """
+    Run the filter and return (matched, output text).
+    """
+    parts, matched = fb.build_ics_parts(ics_text)
+    return matched, b"".join(parts).decode("utf-8")
+
+
+class SpanTests(unittest.TestCase):
+    def test_begin_vevent_inside_a_value(self):
+        ics = feed(["UID:a", "SUMMARY:Spiel", "DTSTART:20251101T180000",
+                    "DESCRIPTION:text BEGIN:VEVENT Braunschweig"])
+        matched, out = filtered(ics)
+        self.assertEqual(matched, 1)
+        self.assertIn("DESCRIPTION:text BEGIN:VEVENT Braunschweig\r\n", out)
+
+    def test_begin_vevent_inside_a_value_when_lower_changes_length(self):
+        # "İ" lowers to two code points, which forces the block-by-block path
+        ics = feed(["UID:a", "SUMMARY:İ", "DTSTART:20251101T180000",
+                    "DESCRIPTION:text BEGIN:VEVENT Braunschweig"])
+        self.assertEqual(filtered(ics)[0], 1)
+
+    def test_block_at_offset_zero(self):
+        ics = "BEGIN:VEVENT\r\nUID:a\r\nSUMMARY:Braunschweig\r\nDTSTART:20251101T180000\r\nEND:VEVENT\r\n"
+        self.assertEqual(list(fb.iter_matching_spans(ics)), [(0, ics.index("\r\nEND:VEVENT") + 1)])
+
+    def test_non_matching_events_are_skipped(self):
+        ics = feed(["UID:a", "SUMMARY:Alba vs Bayern", "DTSTART:20251101T180000"],
+                   ["UID:b", "SUMMARY:Braunschweig vs Ulm", "DTSTART:20251102T180000"])
+        matched, out = filtered(ics)
+        self.assertEqual(matched, 1)
+        self.assertIn("UID:b\r\n", out)
+        self.assertNotIn("UID:a\r\n", out)
+
+
+class DateTests(unittest.TestCase):
+    def test_all_day_event_without_end_lasts_one_day(self):
+        ics = feed(["UID:a", "SUMMARY:Braunschweig", "DTSTART;VALUE=DATE:20251231"])
+        out = filtered(ics)[1]
+        self.assertIn("DTSTART;TZID=Europe/Berlin:20251231T000000\r\n", out)
+        self.assertIn("DTEND;TZID=Europe/Berlin:20260101T000000\r\n", out)
+
+    def test_all_day_event_keeps_its_end(self):
+        ics = feed(["UID:a", "SUMMARY:Braunschweig", "DTSTART;VALUE=DATE:20251105",
+                    "DTEND;VALUE=DATE:20251107"])
+        out = filtered(ics)[1]
+        self.assertIn("DTEND;TZID=Europe/Berlin:20251107T000000\r\n", out)
+        self.assertEqual(out.count("DTEND"), 1)
+
+    def test_trailing_whitespace_in_dates_is_ignored(self):
+        ics = feed(["UID:a", "SUMMARY:Braunschweig", "DTSTART:20251101T180000Z ",
+                    "DTEND:20251101T200000Z\t", "DTSTAMP:20251013T090617Z "])
+        matched, out = filtered(ics)
+        self.assertEqual(matched, 1)
+        self.assertIn("DTSTART;TZID=Europe/Berlin:20251101T180000\r\n", out)
+        self.assertIn("DTEND;TZID=Europe/Berlin:20251101T200000\r\n", out)
+        self.assertIn("CREATED:20251013T090617Z\r\n", out)
+
+    def test_event_without_readable_start_is_skipped(self):
+        ics = feed(["UID:a", "SUMMARY:Braunschweig", "DTSTART:2025-11-01T18:00:00"],
+                   ["UID:b", "SUMMARY:Braunschweig"])
+        with self.assertLogs(level="WARNING") as logs:
+            matched, out = filtered(ics)
+        self.assertEqual(matched, 0)
+        self.assertNotIn("BEGIN:VEVENT", out)
+        self.assertEqual(len(logs.output), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()